@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 """Helper script for processing RAPL data from Intel Software Developer's Manual, Volume 4."""
 
+import csv
 import sys
 
 __author__ = "Connor Imes"
@@ -19,6 +20,19 @@ MSR_DRAM_ENERGY_STATUS = "MSR_DRAM_ENERGY_STATUS" # 0x619
 MSR_PLATFORM_POWER_LIMIT = "MSR_PLATFORM_POWER_LIMIT" # 0x65C
 MSR_PLATFORM_ENERGY_COUNTER = "MSR_PLATFORM_ENERGY_COUNTER" # 0x64D
 
+# Register indexes, in the same order as CPU.REGS
+IDX_RAPL_POWER_UNIT = 0
+IDX_PKG_POWER_LIMIT = 1
+IDX_PKG_ENERGY_STATUS = 2
+IDX_PP0_POWER_LIMIT = 3
+IDX_PP0_ENERGY_STATUS = 4
+IDX_PP1_POWER_LIMIT = 5
+IDX_PP1_ENERGY_STATUS = 6
+IDX_DRAM_POWER_LIMIT = 7
+IDX_DRAM_ENERGY_STATUS = 8
+IDX_PLATFORM_POWER_LIMIT = 9
+IDX_PLATFORM_ENERGY_COUNTER = 10
+
 NONE = "None"
 POWER_DEFAULT = "14.9.1"
 PKG_DEFAULT = "14.9.3"
@@ -26,6 +40,7 @@ PP0_DEFAULT = "14.9.4"
 PP1_DEFAULT = "14.9.4"
 DRAM_DEFAULT = "14.9.5"
 PLATFORM_DEFAULT = "Table 2-38"
+ATOM_DEFAULT = "Table 2-8"
 DRAM_15_3 = "ESU: 15.3 uJ" # assumed for now that this ESU is found in MSR_RAPL_POWER_UNIT
 RESERVED = "Reserved (0)" # this should also be OK (just gets a 0 energy reading)
 
@@ -45,182 +60,160 @@ class CPU(object):
     def __init__(self, cpuid, name, register_dicts):
         self.cpuid = cpuid
         self.name = name
-        self.registers = {}
-        # Later tables override any MSR configs in earlier tables
-        for rdic in register_dicts:
-            self.registers.update(rdic)
+        # Later tables override any MSR configs in earlier tables, so take the last table that specifies each MSR
+        tables = list(reversed(register_dicts))
+        self.registers = [next((rdic[idx] for rdic in tables if idx in rdic), NONE) for idx in range(len(CPU.REGS))]
+        self.row = [cpuid, name] + self.registers
 
     @staticmethod
-    def print_header():
-        """Print header."""
-        sys.stdout.write('Model' + CPU.DELIM + 'Name')
-        for reg in CPU.REGS:
-            sys.stdout.write(CPU.DELIM + reg)
-        sys.stdout.write('\n')
+    def writer(stream):
+        """Get a CSV writer for CPU rows."""
+        return csv.writer(stream, delimiter=CPU.DELIM, lineterminator='\n')
 
-    def print_line(self):
-        """Print line fpr CPU."""
-        sys.stdout.write(self.cpuid + CPU.DELIM  + self.name)
-        for reg in CPU.REGS:
-            sys.stdout.write(CPU.DELIM + self.registers.get(reg, 'None'))
-        sys.stdout.write('\n')
+    @staticmethod
+    def print_header(writer):
+        """Print header."""
+        writer.writerow(['Model', 'Name'] + CPU.REGS)
 
 
 if __name__ == "__main__":
-    CPU.print_header()
-
     TBL_6 = {}
     TBL_7 = {}
-    TBL_8 = {MSR_RAPL_POWER_UNIT: "Table 2-8",
-             MSR_PKG_POWER_LIMIT: "Table 2-8",
-             MSR_PKG_ENERGY_STATUS: PKG_DEFAULT,
-             MSR_PP0_ENERGY_STATUS: PP0_DEFAULT}
+    TBL_8 = {IDX_RAPL_POWER_UNIT: ATOM_DEFAULT,
+             IDX_PKG_POWER_LIMIT: ATOM_DEFAULT,
+             IDX_PKG_ENERGY_STATUS: PKG_DEFAULT,
+             IDX_PP0_ENERGY_STATUS: PP0_DEFAULT}
     TBL_9 = {}
-    TBL_10 = {MSR_RAPL_POWER_UNIT: "Table 2-10 (Same as 2-8)",
-              MSR_PKG_POWER_LIMIT: PKG_DEFAULT,
-              MSR_PKG_ENERGY_STATUS: PKG_DEFAULT}
-    TBL_11 = {MSR_PP0_POWER_LIMIT: "Table 2-11"}
-    ATOM_SILVERMONT = CPU("0x37", "ATOM_SILVERMONT", [TBL_6, TBL_7, TBL_8, TBL_9])
-    ATOM_SILVERMONT.print_line()
-    ATOM_SILVERMONT_MID = CPU("0x4A", "ATOM_SILVERMONT_MID", [TBL_6, TBL_7, TBL_8])
-    ATOM_SILVERMONT_MID.print_line()
-    ATOM_SILVERMONT_X = CPU("0x4D", "ATOM_SILVERMONT_X", [TBL_6, TBL_7, TBL_10])
-    ATOM_SILVERMONT_X.print_line()
-    ATOM_AIRMONT_MID = CPU("0x5A", "ATOM_AIRMONT_MID", [TBL_6, TBL_7, TBL_8])
-    ATOM_AIRMONT_MID.print_line()
-    ATOM_SOFIA = CPU("0x5D", "ATOM_SOFIA", [TBL_6, TBL_7, TBL_8])
-    ATOM_SOFIA.print_line()
-    ATOM_AIRMONT = CPU("0x4C", "ATOM_AIRMONT", [TBL_6, TBL_7, TBL_8, TBL_11])
-    ATOM_AIRMONT.print_line()
-
-    TBL_12 = {MSR_RAPL_POWER_UNIT: POWER_DEFAULT,
-              MSR_PKG_POWER_LIMIT: PKG_DEFAULT,
-              MSR_PKG_ENERGY_STATUS: PKG_DEFAULT,
-              MSR_DRAM_POWER_LIMIT: DRAM_DEFAULT,
-              MSR_DRAM_ENERGY_STATUS: DRAM_DEFAULT,
-              MSR_PP0_ENERGY_STATUS: PP0_DEFAULT,
-              MSR_PP1_ENERGY_STATUS: PP1_DEFAULT}
+    TBL_10 = {IDX_RAPL_POWER_UNIT: "Table 2-10 (Same as 2-8)",
+              IDX_PKG_POWER_LIMIT: PKG_DEFAULT,
+              IDX_PKG_ENERGY_STATUS: PKG_DEFAULT}
+    TBL_11 = {IDX_PP0_POWER_LIMIT: "Table 2-11"}
+
+    TBL_12 = {IDX_RAPL_POWER_UNIT: POWER_DEFAULT,
+              IDX_PKG_POWER_LIMIT: PKG_DEFAULT,
+              IDX_PKG_ENERGY_STATUS: PKG_DEFAULT,
+              IDX_DRAM_POWER_LIMIT: DRAM_DEFAULT,
+              IDX_DRAM_ENERGY_STATUS: DRAM_DEFAULT,
+              IDX_PP0_ENERGY_STATUS: PP0_DEFAULT,
+              IDX_PP1_ENERGY_STATUS: PP1_DEFAULT}
     TBL_13 = {}
-    ATOM_GOLDMONT = CPU("0x5C", "ATOM_GOLDMONT", [TBL_6, TBL_12])
-    ATOM_GOLDMONT.print_line()
-    ATOM_GOLDMONT_X = CPU("0x5F", "ATOM_GOLDMONT_X", []) # not documented? kernel uses standard RAPL conversions
-    ATOM_GOLDMONT_X.print_line()
-    ATOM_GOLDMONT_PLUS = CPU("0x7A", "ATOM_GOLDMONT_PLUS", [TBL_6, TBL_12, TBL_13])
-    ATOM_GOLDMONT_PLUS.print_line()
 
     TBL_14 = {}
-    ATOM_TREMONT_X = CPU("0x86", "ATOM_TREMONT_X", [TBL_6, TBL_12, TBL_13, TBL_14])
-    ATOM_TREMONT_X.print_line()
-
-    TBL_20 = {MSR_RAPL_POWER_UNIT: POWER_DEFAULT,
-              MSR_PKG_POWER_LIMIT: PKG_DEFAULT,
-              MSR_PKG_ENERGY_STATUS: PKG_DEFAULT,
-              MSR_PP0_POWER_LIMIT: PP0_DEFAULT}
-    TBL_21 = {MSR_PP0_ENERGY_STATUS: PP0_DEFAULT,
-              MSR_PP1_POWER_LIMIT: PP1_DEFAULT,
-              MSR_PP1_ENERGY_STATUS: PP1_DEFAULT}
+
+    TBL_20 = {IDX_RAPL_POWER_UNIT: POWER_DEFAULT,
+              IDX_PKG_POWER_LIMIT: PKG_DEFAULT,
+              IDX_PKG_ENERGY_STATUS: PKG_DEFAULT,
+              IDX_PP0_POWER_LIMIT: PP0_DEFAULT}
+    TBL_21 = {IDX_PP0_ENERGY_STATUS: PP0_DEFAULT,
+              IDX_PP1_POWER_LIMIT: PP1_DEFAULT,
+              IDX_PP1_ENERGY_STATUS: PP1_DEFAULT}
     TBL_22 = {}
-    TBL_23 = {MSR_DRAM_POWER_LIMIT: DRAM_DEFAULT,
-              MSR_DRAM_ENERGY_STATUS: DRAM_DEFAULT,
-              MSR_PP0_ENERGY_STATUS: PP0_DEFAULT}
+    TBL_23 = {IDX_DRAM_POWER_LIMIT: DRAM_DEFAULT,
+              IDX_DRAM_ENERGY_STATUS: DRAM_DEFAULT,
+              IDX_PP0_ENERGY_STATUS: PP0_DEFAULT}
     TBL_24 = {}
-    SANDYBRIDGE = CPU("0x2A", "SANDYBRIDGE", [TBL_20, TBL_21, TBL_22])
-    SANDYBRIDGE.print_line()
-    SANDYBRIDGE_X = CPU("0x2D", "SANDYBRIDGE_X", [TBL_20, TBL_23, TBL_24])
-    SANDYBRIDGE_X.print_line()
-
-    TBL_25 = {MSR_PP0_ENERGY_STATUS: PP0_DEFAULT}
-    TBL_26 = {MSR_DRAM_POWER_LIMIT: DRAM_DEFAULT,
-              MSR_DRAM_ENERGY_STATUS: DRAM_DEFAULT,
-              MSR_PP0_ENERGY_STATUS: PP0_DEFAULT}
+
+    TBL_25 = {IDX_PP0_ENERGY_STATUS: PP0_DEFAULT}
+    TBL_26 = {IDX_DRAM_POWER_LIMIT: DRAM_DEFAULT,
+              IDX_DRAM_ENERGY_STATUS: DRAM_DEFAULT,
+              IDX_PP0_ENERGY_STATUS: PP0_DEFAULT}
     TBL_27 = {}
     TBL_28 = {}
-    IVYBRIDGE = CPU("0x3A", "IVYBRIDGE", [TBL_20, TBL_21, TBL_22, TBL_25])
-    IVYBRIDGE.print_line()
-    IVYBRIDGE_X = CPU("0x3E", "IVYBRIDGE_X", [TBL_20, TBL_24, TBL_26, TBL_27, TBL_28])
-    IVYBRIDGE_X.print_line()
-
-    TBL_29 = {MSR_DRAM_ENERGY_STATUS: DRAM_DEFAULT}
-    TBL_30 = {MSR_RAPL_POWER_UNIT: POWER_DEFAULT,
-              MSR_PP0_ENERGY_STATUS: PP0_DEFAULT,
-              MSR_PP1_POWER_LIMIT: PP1_DEFAULT,
-              MSR_PP1_ENERGY_STATUS: PP1_DEFAULT}
+
+    TBL_29 = {IDX_DRAM_ENERGY_STATUS: DRAM_DEFAULT}
+    TBL_30 = {IDX_RAPL_POWER_UNIT: POWER_DEFAULT,
+              IDX_PP0_ENERGY_STATUS: PP0_DEFAULT,
+              IDX_PP1_POWER_LIMIT: PP1_DEFAULT,
+              IDX_PP1_ENERGY_STATUS: PP1_DEFAULT}
     TBL_31 = {}
-    TBL_32 = {MSR_RAPL_POWER_UNIT: POWER_DEFAULT,
-              MSR_DRAM_POWER_LIMIT: DRAM_DEFAULT,
-              MSR_DRAM_ENERGY_STATUS: DRAM_15_3,
-              MSR_PP0_ENERGY_STATUS: RESERVED}
+    TBL_32 = {IDX_RAPL_POWER_UNIT: POWER_DEFAULT,
+              IDX_DRAM_POWER_LIMIT: DRAM_DEFAULT,
+              IDX_DRAM_ENERGY_STATUS: DRAM_15_3,
+              IDX_PP0_ENERGY_STATUS: RESERVED}
     TBL_33 = {}
-    # TBL_25 specified at end of TBL_30
-    HASWELL_CORE = CPU("0x3C", "HASWELL_CORE", [TBL_20, TBL_21, TBL_22, TBL_25, TBL_29, TBL_30])
-    HASWELL_CORE.print_line()
-    HASWELL_X = CPU("0x3F", "HASWELL_X", [TBL_20, TBL_29, TBL_32, TBL_33])
-    HASWELL_X.print_line()
-    # TBL_22 specified at end of TBL_31
-    HASWELL_ULT = CPU("0x45", "HASWELL_ULT", [TBL_20, TBL_21, TBL_22, TBL_29, TBL_30, TBL_31])
-    HASWELL_ULT.print_line()
-    # TBL_25 specified at end of TBL_30
-    HASWELL_GT3E = CPU("0x46", "HASWELL_GT3E", [TBL_20, TBL_21, TBL_22, TBL_25, TBL_29, TBL_30])
-    HASWELL_GT3E.print_line()
 
     TBL_34 = {}
-    TBL_35 = {MSR_PP0_ENERGY_STATUS: PP0_DEFAULT}
-    TBL_36 = {MSR_RAPL_POWER_UNIT: POWER_DEFAULT,
-              MSR_DRAM_POWER_LIMIT: DRAM_DEFAULT,
-              MSR_DRAM_ENERGY_STATUS: DRAM_15_3,
-              MSR_PP0_ENERGY_STATUS: RESERVED}
+    TBL_35 = {IDX_PP0_ENERGY_STATUS: PP0_DEFAULT}
+    TBL_36 = {IDX_RAPL_POWER_UNIT: POWER_DEFAULT,
+              IDX_DRAM_POWER_LIMIT: DRAM_DEFAULT,
+              IDX_DRAM_ENERGY_STATUS: DRAM_15_3,
+              IDX_PP0_ENERGY_STATUS: RESERVED}
     TBL_37 = {}
     TBL_38 = {}
-    BROADWELL_CORE = CPU("0x3D", "BROADWELL_CORE", [TBL_20, TBL_21, TBL_22, TBL_25, TBL_29, TBL_30, TBL_34, TBL_35])
-    BROADWELL_CORE.print_line()
-    BROADWELL_GT3E = CPU("0x47", "BROADWELL_GT3E", [TBL_20, TBL_21, TBL_22, TBL_25, TBL_29, TBL_30, TBL_34, TBL_35])
-    BROADWELL_GT3E.print_line()
-    # BROADWELL_X: Section 2.16.2 specifies the prior tables for this architecture.
-    # TODO: Also TBL_37? Mentioned at start of Section 2.16.2, but not included in explicit list
-    # TODO: Comment at end of TBL_38 is for 0x45? Won't use (no effect on results anyway)...
-    BROADWELL_X = CPU("0x4F", "BROADWELL_X", [TBL_20, TBL_21, TBL_29, TBL_34, TBL_36, TBL_38])
-    BROADWELL_X.print_line()
-    # BROADWELL_XEON_D: See 2.16.1 for mention of Tables 19 and 28
-    BROADWELL_XEON_D = CPU("0x56", "BROADWELL_XEON_D", [TBL_20, TBL_29, TBL_34, TBL_36, TBL_37])
-    BROADWELL_XEON_D.print_line()
-
-    TBL_39 = {MSR_PP0_ENERGY_STATUS: PP0_DEFAULT,
-              MSR_PLATFORM_ENERGY_COUNTER: PLATFORM_DEFAULT,
-              MSR_PLATFORM_POWER_LIMIT: PLATFORM_DEFAULT}
+
+    TBL_39 = {IDX_PP0_ENERGY_STATUS: PP0_DEFAULT,
+              IDX_PLATFORM_ENERGY_COUNTER: PLATFORM_DEFAULT,
+              IDX_PLATFORM_POWER_LIMIT: PLATFORM_DEFAULT}
     TBL_40 = {}
     TBL_41 = {}
     TBL_42 = {}
     TBL_43 = {}
     TBL_44 = {}
-    TBL_45 = {MSR_RAPL_POWER_UNIT: POWER_DEFAULT,
-              MSR_DRAM_POWER_LIMIT: DRAM_DEFAULT,
-              MSR_DRAM_ENERGY_STATUS: DRAM_15_3,
-              MSR_PP0_ENERGY_STATUS: RESERVED}
-    SKYLAKE_MOBILE = CPU("0x4E", "SKYLAKE_MOBILE", [TBL_20, TBL_21, TBL_25, TBL_29, TBL_35, TBL_39, TBL_40])
-    SKYLAKE_MOBILE.print_line()
-    # Top of Section 2.17 says TBL_40 (Uncore) is used for 0x55, but TBL_40 doesn't mention it
-    SKYLAKE_X = CPU("0x55", "SKYLAKE_X", [TBL_20, TBL_21, TBL_25, TBL_29, TBL_35, TBL_39, TBL_45])
-    SKYLAKE_X.print_line()
-    SKYLAKE_DESKTOP = CPU("0x5E", "SKYLAKE_DESKTOP", [TBL_20, TBL_21, TBL_25, TBL_29, TBL_35, TBL_39, TBL_40])
-    SKYLAKE_DESKTOP.print_line()
-    KABYLAKE_MOBILE = CPU("0x8E", "KABYLAKE_MOBILE", [TBL_20, TBL_21, TBL_25, TBL_29, TBL_35, TBL_39, TBL_40, TBL_41])
-    KABYLAKE_MOBILE.print_line()
-    KABYLAKE_DESKTOP = CPU("0x9E", "KABYLAKE_DESKTOP", [TBL_20, TBL_21, TBL_25, TBL_29, TBL_35, TBL_39, TBL_40, TBL_41])
-    KABYLAKE_DESKTOP.print_line()
-    CANNONLAKE_MOBILE = CPU("0x66", "CANNONLAKE_MOBILE", [TBL_20, TBL_21, TBL_25, TBL_29, TBL_35, TBL_39, TBL_40, TBL_42, TBL_43])
-    CANNONLAKE_MOBILE.print_line()
-
-    TBL_46 = {MSR_RAPL_POWER_UNIT: POWER_DEFAULT,
-              MSR_PKG_POWER_LIMIT: PKG_DEFAULT,
-              MSR_PKG_ENERGY_STATUS: PKG_DEFAULT,
-              MSR_DRAM_POWER_LIMIT: DRAM_DEFAULT,
-              MSR_DRAM_ENERGY_STATUS: DRAM_DEFAULT, # community consensus is that Xeon Phi should be DRAM_15_3
-              MSR_PP0_POWER_LIMIT: PP0_DEFAULT,
-              MSR_PP0_ENERGY_STATUS: PP0_DEFAULT}
+    TBL_45 = {IDX_RAPL_POWER_UNIT: POWER_DEFAULT,
+              IDX_DRAM_POWER_LIMIT: DRAM_DEFAULT,
+              IDX_DRAM_ENERGY_STATUS: DRAM_15_3,
+              IDX_PP0_ENERGY_STATUS: RESERVED}
+
+    TBL_46 = {IDX_RAPL_POWER_UNIT: POWER_DEFAULT,
+              IDX_PKG_POWER_LIMIT: PKG_DEFAULT,
+              IDX_PKG_ENERGY_STATUS: PKG_DEFAULT,
+              IDX_DRAM_POWER_LIMIT: DRAM_DEFAULT,
+              IDX_DRAM_ENERGY_STATUS: DRAM_DEFAULT, # community consensus is that Xeon Phi should be DRAM_15_3
+              IDX_PP0_POWER_LIMIT: PP0_DEFAULT,
+              IDX_PP0_ENERGY_STATUS: PP0_DEFAULT}
     TBL_47 = {}
-    XEON_PHI_KNL = CPU("0x57", "XEON_PHI_KNL", [TBL_46])
-    XEON_PHI_KNL.print_line()
-    XEON_PHI_KNM = CPU("0x85", "XEON_PHI_KNM", [TBL_46, TBL_47])
-    XEON_PHI_KNM.print_line()
+
+    CPU_SPECS = [
+        ("0x37", "ATOM_SILVERMONT", [TBL_6, TBL_7, TBL_8, TBL_9]),
+        ("0x4A", "ATOM_SILVERMONT_MID", [TBL_6, TBL_7, TBL_8]),
+        ("0x4D", "ATOM_SILVERMONT_X", [TBL_6, TBL_7, TBL_10]),
+        ("0x5A", "ATOM_AIRMONT_MID", [TBL_6, TBL_7, TBL_8]),
+        ("0x5D", "ATOM_SOFIA", [TBL_6, TBL_7, TBL_8]),
+        ("0x4C", "ATOM_AIRMONT", [TBL_6, TBL_7, TBL_8, TBL_11]),
+
+        ("0x5C", "ATOM_GOLDMONT", [TBL_6, TBL_12]),
+        ("0x5F", "ATOM_GOLDMONT_X", []), # not documented? kernel uses standard RAPL conversions
+        ("0x7A", "ATOM_GOLDMONT_PLUS", [TBL_6, TBL_12, TBL_13]),
+
+        ("0x86", "ATOM_TREMONT_X", [TBL_6, TBL_12, TBL_13, TBL_14]),
+
+        ("0x2A", "SANDYBRIDGE", [TBL_20, TBL_21, TBL_22]),
+        ("0x2D", "SANDYBRIDGE_X", [TBL_20, TBL_23, TBL_24]),
+
+        ("0x3A", "IVYBRIDGE", [TBL_20, TBL_21, TBL_22, TBL_25]),
+        ("0x3E", "IVYBRIDGE_X", [TBL_20, TBL_24, TBL_26, TBL_27, TBL_28]),
+
+        # TBL_25 specified at end of TBL_30
+        ("0x3C", "HASWELL_CORE", [TBL_20, TBL_21, TBL_22, TBL_25, TBL_29, TBL_30]),
+        ("0x3F", "HASWELL_X", [TBL_20, TBL_29, TBL_32, TBL_33]),
+        # TBL_22 specified at end of TBL_31
+        ("0x45", "HASWELL_ULT", [TBL_20, TBL_21, TBL_22, TBL_29, TBL_30, TBL_31]),
+        # TBL_25 specified at end of TBL_30
+        ("0x46", "HASWELL_GT3E", [TBL_20, TBL_21, TBL_22, TBL_25, TBL_29, TBL_30]),
+
+        ("0x3D", "BROADWELL_CORE", [TBL_20, TBL_21, TBL_22, TBL_25, TBL_29, TBL_30, TBL_34, TBL_35]),
+        ("0x47", "BROADWELL_GT3E", [TBL_20, TBL_21, TBL_22, TBL_25, TBL_29, TBL_30, TBL_34, TBL_35]),
+        # BROADWELL_X: Section 2.16.2 specifies the prior tables for this architecture.
+        # TODO: Also TBL_37? Mentioned at start of Section 2.16.2, but not included in explicit list
+        # TODO: Comment at end of TBL_38 is for 0x45? Won't use (no effect on results anyway)...
+        ("0x4F", "BROADWELL_X", [TBL_20, TBL_21, TBL_29, TBL_34, TBL_36, TBL_38]),
+        # BROADWELL_XEON_D: See 2.16.1 for mention of Tables 19 and 28
+        ("0x56", "BROADWELL_XEON_D", [TBL_20, TBL_29, TBL_34, TBL_36, TBL_37]),
+
+        ("0x4E", "SKYLAKE_MOBILE", [TBL_20, TBL_21, TBL_25, TBL_29, TBL_35, TBL_39, TBL_40]),
+        # Top of Section 2.17 says TBL_40 (Uncore) is used for 0x55, but TBL_40 doesn't mention it
+        ("0x55", "SKYLAKE_X", [TBL_20, TBL_21, TBL_25, TBL_29, TBL_35, TBL_39, TBL_45]),
+        ("0x5E", "SKYLAKE_DESKTOP", [TBL_20, TBL_21, TBL_25, TBL_29, TBL_35, TBL_39, TBL_40]),
+        ("0x8E", "KABYLAKE_MOBILE", [TBL_20, TBL_21, TBL_25, TBL_29, TBL_35, TBL_39, TBL_40, TBL_41]),
+        ("0x9E", "KABYLAKE_DESKTOP", [TBL_20, TBL_21, TBL_25, TBL_29, TBL_35, TBL_39, TBL_40, TBL_41]),
+        ("0x66", "CANNONLAKE_MOBILE", [TBL_20, TBL_21, TBL_25, TBL_29, TBL_35, TBL_39, TBL_40, TBL_42, TBL_43]),
+
+        ("0x57", "XEON_PHI_KNL", [TBL_46]),
+        ("0x85", "XEON_PHI_KNM", [TBL_46, TBL_47]),
+    ]
+
+    WRITER = CPU.writer(sys.stdout)
+    CPU.print_header(WRITER)
+    WRITER.writerows(CPU(*spec).row for spec in CPU_SPECS)
 
     # Last updated for Software Developer's Manual, Volume 4 - May 2019